@@ -1,14 +1,78 @@
-from pyproj import CRS, Transformer
-from pyproj.transformer import TransformerGroup
-from pyproj.exceptions import CRSError
+from pyproj import CRS, Transformer, __version__ as pyproj_version
+from pyproj.exceptions import CRSError, ProjError
 from rasterio import Affine
 import shapely.geometry
 
 
-from typing import Any, Optional, Union, Iterable, List, Tuple, Callable
-import copy
-
-from .util.helpers import generate_points, approximate_transform, interpolate_polygon
+from typing import Any, Optional, Union, Iterable, Iterator, List, Tuple, Callable
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import islice
+import os
+
+import numpy as np
+
+from .util.helpers import generate_axes, approximate_transform, approximate_transform_from_grid, apply_affine, interpolated_length, interpolate_polygon, _as_points
+
+_TRANSFORM_INPLACE = tuple(map(int, pyproj_version.split('.')[:2])) >= (3, 2) # `inplace` was added to `Transformer.transform` in 3.2
+_SCALAR_MAX_POINTS = 16 # up to this many points, calling the project function per point is faster than building and projecting an array
+
+@lru_cache(maxsize = 128)
+def _build_transformer(
+    crs_from_wkt: str,
+    crs_to_wkt: str
+) -> Transformer:
+    '''
+    Builds the `Transformer` used to project from `crs_from_wkt` to `crs_to_wkt`, cached per CRS pair
+
+    The cache is keyed on WKT strings, which compare as plain strings (unlike `CRS.__eq__` which goes through PROJ),
+    and it is shared by every `Projector` in the process; `Transformer` instances are safe to share between threads
+    '''
+    try:
+        return Transformer.from_crs(crs_from_wkt, crs_to_wkt, always_xy = True)
+    except ProjError as e:
+        raise CRSError("No transformer available.") from e
+
+@lru_cache(maxsize = 256)
+def _cached_crs(
+    user_input: Any
+) -> CRS:
+    return CRS.from_user_input(user_input)
+
+def _parse_crs(
+    user_input: Any
+) -> CRS:
+    '''
+    Parses `user_input` with `CRS.from_user_input`, cached for hashable inputs (EPSG codes, strings, ...)
+    '''
+    if isinstance(user_input, CRS): return user_input
+    try:
+        hash(user_input)
+    except TypeError: # e.g. dict of PROJ parameters
+        return CRS.from_user_input(user_input)
+    return _cached_crs(user_input)
+
+def _clone_json(
+    value: Any
+) -> Any:
+    '''
+    Copies a JSON-like value (nested `dict`s and `list`s of scalars), much faster than `copy.deepcopy`
+
+    Anything other than a `dict` or `list` is treated as immutable and returned as is
+    '''
+    if isinstance(value, dict): return {k: _clone_json(v) for k, v in value.items()}
+    if isinstance(value, list): return [_clone_json(v) for v in value]
+    return value
+
+def _to_numpy(
+    array: Any
+) -> np.ndarray:
+    '''
+    Converts an array returned by the internal project function to a NumPy array, copying device arrays (e.g. CuPy's, which have `get`) to the host
+    '''
+    if not isinstance(array, np.ndarray) and hasattr(array, 'get'): return array.get()
+    return np.asarray(array)
 
 class Projector:
     def __init__(
@@ -20,39 +84,55 @@ class Projector:
         '''
         Creates `Projector` instance for projecting from `crs_from` to `crs_to`, or using an existing 'project_point' function
 
+        If `crs_from` and `crs_to` are equivalent, no `Transformer` is built and points are returned unchanged
+
         Args:
             `crs_from` (`Any`, optional): Start CRS
             `crs_to` (`Any`, optional): Destination CRS
             `project_function` (`Callable[[float, float], Tuple[float, float]]`, optional): Projector's internal project function (if passed, `crs_from` and `crs_to` are ignored)
         '''
+        self._vectorized_only: bool = False # whether small inputs should still go through `_project_points_xy` (e.g. GPU-backed transformers)
         if not project_function:
             try:
-                crs_from, crs_to = CRS.from_user_input(crs_from), CRS.from_user_input(crs_to)
-                transformers = TransformerGroup(crs_from = crs_from, crs_to = crs_to, always_xy = True).transformers
-
-                if not transformers:
-                    raise CRSError("No transformer available.")
-                
-                self._project_point: Callable[[float, float], Tuple[float, float]] = transformers[0].transform
-            except:
+                crs_from, crs_to = _parse_crs(crs_from), _parse_crs(crs_to)
+            except (CRSError, ProjError, TypeError, ValueError) as e:
                 raise CRSError(
                     'crs_from and crs_to must have valid CRS formats, for example:\n'
                     'EPSG code as int: 4326\n'
                     'EPSG code as str: "EPSG:4326"\n'
                     'PROJ string: "+proj=longlat +datum=WGS84"\n'
                     'CRS instance: CRS.from_epsg(4326)'
-                )
+                ) from e
+            self._crs_from: Optional[CRS] = crs_from
+            self._crs_to: Optional[CRS] = crs_to
+            if crs_from.equals(crs_to, ignore_axis_order = True): # axis order is irrelevant since the transformer would use always_xy = True
+                self._transformer: Optional[Transformer] = None
+                self._project_point: Callable[[float, float], Tuple[float, float]] = lambda x, y: (x, y)
+                self._project_points_xy: Optional[Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]] = \
+                    lambda xs, ys: (np.array(xs, dtype = np.float64), np.array(ys, dtype = np.float64))
+            else:
+                self._transformer: Optional[Transformer] = _build_transformer(crs_from.to_wkt(), crs_to.to_wkt())
+                self._project_point: Callable[[float, float], Tuple[float, float]] = self._transformer.transform
+                self._project_points_xy: Optional[Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]] = self._transformer.transform
         else:
             assert isinstance(project_function, Callable), \
                 "Project function must take two float arguments and return a tuple of two floats."
+            self._crs_from: Optional[CRS] = None
+            self._crs_to: Optional[CRS] = None
+            self._transformer: Optional[Transformer] = None
             self._project_point: Callable[[float, float], Tuple[float, float]] = project_function
+            self._project_points_xy: Optional[Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]] = None
 
     @classmethod
     def from_pyproj_transformer(
+        cls,
         transformer: Transformer
     ):
         '''
-        Creates `Projector` instance using an existing PyProj `Transformer` instance
+        Creates `Projector` instance using an existing PyProj `Transformer` instance, without rebuilding it from its CRSs
+
+        Any object with a PyProj-compatible vectorized `transform(xs, ys)` is accepted, e.g. a GPU-backed `cuproj.Transformer`
+        for very large batches (`project_points_xy` then returns that library's arrays as is, the other methods copy them back to NumPy)
 
         Args:
             `transformer` (`Transformer`, optional): `Transformer` instance whose `transform` function will be used as Projector's internal project function
@@ -60,10 +140,16 @@ class Projector:
         Returns:
             `Projector`: `Projector` instance that uses `transformer.transform` as its internal project function
         '''
-        return Projector(project_function = transformer.transform)
+        projector = cls(project_function = transformer.transform)
+        projector._crs_from, projector._crs_to = getattr(transformer, 'source_crs', None), getattr(transformer, 'target_crs', None)
+        projector._transformer = transformer if isinstance(transformer, Transformer) else None
+        projector._project_points_xy = transformer.transform
+        projector._vectorized_only = not isinstance(transformer, Transformer)
+        return projector
     
     @classmethod
     def from_affine_transform(
+        cls,
         transform: Affine
     ):
         '''
@@ -75,7 +161,23 @@ class Projector:
         Returns:
             `Projector`: `Projector` instance that uses `transform` as its internal project function
         '''
-        return Projector(project_function = lambda x, y: transform * (x, y))
+        a, b, c, d, e, f = transform.a, transform.b, transform.c, transform.d, transform.e, transform.f
+        project_function = lambda x, y: (a * x + b * y + c, d * x + e * y + f) # works on floats and arrays alike
+        projector = cls(project_function = project_function)
+        projector._project_points_xy = project_function
+        return projector
+
+    @property
+    def crs_from(
+        self
+    ) -> Optional[CRS]:
+        return self._crs_from
+
+    @property
+    def crs_to(
+        self
+    ) -> Optional[CRS]:
+        return self._crs_to
 
     @property
     def project_point(
@@ -88,31 +190,179 @@ class Projector:
         self,
         new_project_point: Callable[[float, float], Tuple[float, float]]
     ) -> None:
-        assert isinstance(project_function, Callable), \
+        assert isinstance(new_project_point, Callable), \
             "Project function must take two float arguments and return a tuple of two floats."
+        self._crs_from, self._crs_to = None, None
+        self._transformer = None
         self._project_point = new_project_point
+        self._project_points_xy = None
+        self._vectorized_only = False
+
+    def project_points_xy(
+        self,
+        xs: np.ndarray,
+        ys: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        '''
+        Projects arrays of x and y coordinates from the start CRS to the destination CRS
+
+        This is the fastest way to project many points: when the projector wraps a PyProj `Transformer` or an `Affine` transform,
+        both arrays are projected in a single vectorized call instead of one call per point
+
+        Args:
+            `xs` (`np.ndarray`): x coordinates in the start CRS
+            `ys` (`np.ndarray`): y coordinates in the start CRS
+
+        Returns:
+            `Tuple[np.ndarray, np.ndarray]`: Projected x and y coordinates
+        '''
+        if self._project_points_xy is not None:
+            return self._project_points_xy(xs, ys)
+        projected = [self._project_point(x, y) for x, y in zip(np.asarray(xs).tolist(), np.asarray(ys).tolist())]
+        return np.array([x for x, _ in projected], dtype = np.float64), np.array([y for _, y in projected], dtype = np.float64)
     
+    def _project_buffer(
+        self,
+        buffer: np.ndarray
+    ) -> np.ndarray:
+        '''
+        Projects the points of a contiguous `(2, N)` float64 buffer (x coordinates then y coordinates)
+
+        With a PyProj `Transformer` the buffer is transformed in place, so no other copy of the points is made
+
+        Args:
+            `buffer` (`np.ndarray`): Points in the start CRS, overwritten if possible
+
+        Returns:
+            `np.ndarray`: Projected points as an `(N, 2)` float64 array (possibly a view of `buffer`)
+        '''
+        if self._transformer is not None and _TRANSFORM_INPLACE:
+            self._transformer.transform(buffer[0], buffer[1], inplace = True)
+            return buffer.T
+        xs, ys = self.project_points_xy(buffer[0], buffer[1])
+        return np.column_stack([_to_numpy(xs), _to_numpy(ys)])
+
+    def _project_points_array(
+        self,
+        points: Iterable[Union[Tuple[float, float], List[float]]]
+    ) -> np.ndarray:
+        '''
+        Projects points from the start CRS to the destination CRS, keeping them as an `(N, 2)` array
+
+        The points are copied once into a contiguous `(2, N)` buffer (see `_project_buffer`),
+        instead of copying each (strided) column in and stacking the results back together
+
+        Args:
+            `points` (`Iterable[Union[Tuple[float, float], List[float]]]`): Points in the start CRS
+
+        Returns:
+            `np.ndarray`: Projected points as an `(N, 2)` float64 array
+        '''
+        return self._project_buffer(np.array(_as_points(points).T, order = "C")) # always a copy, never the caller's memory
+
+    def _project_coordinates(
+        self,
+        coordinates: np.ndarray
+    ) -> np.ndarray:
+        '''
+        Projects an `(N, 2)` or `(N, 3)` array of coordinates (as passed by `shapely.transform`), keeping z coordinates as is
+
+        Args:
+            `coordinates` (`np.ndarray`): Coordinates in the start CRS
+
+        Returns:
+            `np.ndarray`: Projected coordinates, with the shape of `coordinates`
+        '''
+        if coordinates.ndim != 2 or coordinates.shape[1] != 3: return self._project_points_array(coordinates)
+        projected = np.array(coordinates, dtype = np.float64)
+        projected[:, :2] = self._project_points_array(coordinates[:, :2])
+        return projected
+
+    def _project_rings(
+        self,
+        rings: List[Iterable[Union[Tuple[float, float], List[float]]]],
+        interpolation: Optional[int] = None,
+        self_closing: bool = True
+    ) -> List[np.ndarray]:
+        '''
+        Projects rings from the start CRS to the destination CRS using a single call to the internal project function
+
+        The (interpolated) rings are written directly into one shared buffer, which is projected and split back into rings
+
+        Args:
+            `rings` (`List[Iterable[Union[Tuple[float, float], List[float]]]]`): Rings in iterable format
+            `interpolation` (`int`, optional): Number of points projected per segment
+            `self_closing` (`bool`, optional): Whether the rings are self-closing i.e. `ring[0] == ring[-1]`
+
+        Returns:
+            `List[np.ndarray]`: Projected rings as `(N, 2)` float64 arrays
+        '''
+        interpolate = interpolation and interpolation > 1
+        rings = [_as_points(ring) for ring in rings]
+        offsets = np.cumsum([0] + [interpolated_length(len(ring), interpolation, self_closing) if interpolate else len(ring) for ring in rings])
+        buffer = np.empty((2, offsets[-1]), dtype = np.float64)
+        for ring, start, end in zip(rings, offsets[:-1], offsets[1:]):
+            if interpolate: interpolate_polygon(ring, interpolation, self_closing, out = buffer.T[start:end])
+            else: buffer.T[start:end] = ring
+        projected = self._project_buffer(buffer)
+        return [projected[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def _project_ring_lists(
+        self,
+        rings: List[Iterable[Union[Tuple[float, float], List[float]]]],
+        interpolation: Optional[int] = None
+    ) -> List[List[List[float]]]:
+        '''
+        Same as `_project_rings` (for self-closing rings), returning the rings as lists of `[x, y]` lists as used by GeoJSON
+
+        Without interpolation, rings with up to `_SCALAR_MAX_POINTS` points in total are projected one point at a time, skipping the buffer setup
+
+        Args:
+            `rings` (`List[Iterable[Union[Tuple[float, float], List[float]]]]`): Rings in iterable format
+            `interpolation` (`int`, optional): Number of points projected per segment
+
+        Returns:
+            `List[List[List[float]]]`: Projected rings
+        '''
+        if (not interpolation or interpolation <= 1) and not self._vectorized_only and sum(len(ring) for ring in rings) <= _SCALAR_MAX_POINTS:
+            return [[list(self._project_point(x, y)) for x, y in ring] for ring in rings]
+        return [ring.tolist() for ring in self._project_rings(rings, interpolation)]
+
     def project_points(
         self, 
         points: Iterable[Union[Tuple[float, float], List[float]]]
-    ) -> List[Tuple[float, float]]:
+    ) -> Union[List[Tuple[float, float]], np.ndarray]:
         '''
         Projects a list of points from the start CRS to the destination CRS
+
+        Lists and tuples of up to `_SCALAR_MAX_POINTS` points are projected one by one, which is faster than building an array for so few points
+
+        Iterators (e.g. generators) are streamed through `Transformer.itransform` when the projector wraps a PyProj `Transformer`
+
+        Points are always `(x, y)` pairs (a `ValueError` is raised otherwise), in the axis order of the transformer:
+        projectors built from CRSs use `always_xy = True`, while `from_pyproj_transformer` keeps the given transformer's axis order
         
         Args:
             `points` (`Iterable[Union[Tuple[float, float], List[float]]]`): Points in the start CRS
     
         Returns:
-            `List[Tuple[float, float]]`: Projected list of points
+            `Union[List[Tuple[float, float]], np.ndarray]`: Projected list of points (an `(N, 2)` array if `points` is an `np.ndarray`)
         '''
-        return [self._project_point(x, y) for x, y in points]
+        if type(points) in (list, tuple) and len(points) <= _SCALAR_MAX_POINTS and not self._vectorized_only:
+            return [self._project_point(x, y) for x, y in points]
+        if isinstance(points, Iterator):
+            if self._transformer is not None:
+                return list(self._transformer.itransform((x, y) for x, y in points)) # unpacking rejects (x, y, z) points, like the other paths
+            points = list(points)
+        projected = self._project_points_array(points)
+        return projected if isinstance(points, np.ndarray) else list(zip(projected[:, 0].tolist(), projected[:, 1].tolist()))
     
     def project_polygon(
         self, 
         polygon: Iterable[Union[Tuple[float, float], List[float]]], 
         interpolation: Optional[int] = None, 
         self_closing: bool = False
-    ) -> List[Tuple[float, float]]:
+    ) -> Union[List[Tuple[float, float]], np.ndarray]:
         '''
         Projects a polygon in iterable format from the start CRS to the destination CRS
 
@@ -122,11 +372,13 @@ class Projector:
             `self_closing` (`bool`, optional): Whether the polygon is self-closing i.e. `polygon[0] == polygon[-1]`
 
         Returns:
-            `List[Tuple[float, float]]`: Projected polygon
+            `Union[List[Tuple[float, float]], np.ndarray]`: Projected polygon (an `(N, 2)` array if `polygon` is an `np.ndarray`)
         '''
-        return self.project_points(interpolate_polygon(polygon, interpolation, self_closing)) if interpolation else self.project_points(polygon)
+        if not interpolation or interpolation <= 1: return self.project_points(polygon)
+        projected = self._project_rings([polygon], interpolation, self_closing)[0]
+        return projected if isinstance(polygon, np.ndarray) else list(zip(projected[:, 0].tolist(), projected[:, 1].tolist()))
 
-    def project_line(self, line: Iterable[Union[Tuple[float, float], List[float]]], interpolation: Optional[int] = None) -> List[Tuple[float, float]]:
+    def project_line(self, line: Iterable[Union[Tuple[float, float], List[float]]], interpolation: Optional[int] = None) -> Union[List[Tuple[float, float]], np.ndarray]:
         '''
         Projects a line in iterable format from the start CRS to the destination CRS
 
@@ -135,14 +387,39 @@ class Projector:
             interpolation (`int`, optional): Number of points projected per segment
 
         Returns:
-            `List[Tuple[float, float]]`: Projected line
+            `Union[List[Tuple[float, float]], np.ndarray]`: Projected line (an `(N, 2)` array if `line` is an `np.ndarray`)
         '''
         return self.project_polygon(line, interpolation, True)
 
+    def _map(
+        self,
+        function: Callable[[Any], Any],
+        items: Iterable[Any],
+        threaded: bool = False
+    ) -> List[Any]:
+        '''
+        Applies `function` to every item, in a thread pool if `threaded`
+
+        Threads only run concurrently for PyProj-based projectors, since PyProj releases the GIL inside PROJ
+        (`Transformer` instances can be shared between threads)
+
+        Args:
+            `function` (`Callable[[Any], Any]`): Function to apply
+            `items` (`Iterable[Any]`): Items to apply it to
+            `threaded` (`bool`, optional): Whether to use a thread pool with one worker per CPU
+
+        Returns:
+            `List[Any]`: Results, in the order of `items`
+        '''
+        if not threaded: return [function(item) for item in items]
+        with ThreadPoolExecutor(max_workers = os.cpu_count()) as executor:
+            return list(executor.map(function, items))
+
     def project_shapely_object(
         self, 
         shapely_object: Union[shapely.geometry.Point, shapely.geometry.LineString, shapely.geometry.LinearRing, shapely.geometry.Polygon, shapely.geometry.MultiPoint, shapely.geometry.MultiLineString, shapely.geometry.MultiPolygon, shapely.geometry.GeometryCollection], 
-        interpolation: Optional[int] = None
+        interpolation: Optional[int] = None,
+        threaded: bool = False
     ) ->  Union[shapely.geometry.Point, shapely.geometry.LineString, shapely.geometry.LinearRing, shapely.geometry.Polygon, shapely.geometry.MultiPoint, shapely.geometry.MultiLineString, shapely.geometry.MultiPolygon, shapely.geometry.GeometryCollection]:
         """
         Projects a Shapely object (`Point`, `LineString`, `LinearRing`, `Polygon`, `MultiPoint`, `MultiLineString`, `MultiPolygon`, `GeometryCollection`) 
@@ -151,27 +428,38 @@ class Projector:
         Args:
             `shapely_object` (`Union[shapely.geometry.Point, shapely.geometry.LineString, shapely.geometry.LinearRing, shapely.geometry.Polygon, shapely.geometry.MultiPoint, shapely.geometry.MultiLineString, shapely.geometry.MultiPolygon, shapely.geometry.GeometryCollection]`): Shapely object
             `interpolation` (`int`, optional): Number of points projected per line (ignored if type is `Point`)
+            `threaded` (`bool`, optional): Whether the parts of a `MultiPolygon` / `GeometryCollection` are projected in parallel threads (only used with `interpolation`,
+            since otherwise all coordinates are projected in a single call)
 
         Returns:
             `Union[shapely.geometry.Point, shapely.geometry.LineString, shapely.geometry.LinearRing, shapely.geometry.Polygon, shapely.geometry.MultiPoint, shapely.geometry.MultiLineString, shapely.geometry.MultiPolygon, shapely.geometry.GeometryCollection]`: Projected Shapely object
         
         Raises:
             `TypeError`: If type of Shapely object isn't one of: `Point`, `LineString`, `LinearRing`, `Polygon`, `MultiPoint`, `MultiLineString`, `MultiPolygon`, `GeometryCollection`
+            `ValueError`: If `interpolation` is used on a 3D Shapely object (without interpolation, z coordinates are kept as is)
         """
         shapely_type = type(shapely_object)
-        if shapely_type == shapely.geometry.Point: return shapely.geometry.Point(*self.project_point(shapely_object.x, shapely_object.y))
-        elif shapely_type == shapely.geometry.LineString: return shapely.geometry.LineString(self.project_line(shapely_object.coords, interpolation))
-        elif shapely_type == shapely.geometry.LinearRing: return shapely.geometry.LinearRing(self.project_polygon(shapely_object.coords, interpolation, True))
-        elif shapely_type == shapely.geometry.Polygon: return shapely.geometry.Polygon(self.project_polygon(shapely_object.exterior.coords, interpolation, True), holes = [self.project_polygon(ring.coords, interpolation, True) for ring in shapely_object.interiors])
-        elif shapely_type == shapely.geometry.MultiPoint: return shapely.geometry.MultiPoint(self.project_points([(point.x, point.y) for point in shapely_object]))
-        elif shapely_type == shapely.geometry.MultiLineString: return shapely.geometry.MultiLineString([self.project_line(line.coords, interpolation) for line in shapely_object])
-        elif shapely_type in [shapely.geometry.MultiPolygon, shapely.geometry.GeometryCollection]: return shapely_type([self.project_shapely_object(internal_shapely_object, interpolation) for internal_shapely_object in shapely_object])
+        if shapely_type == shapely.geometry.Point and not self._vectorized_only and not shapely_object.is_empty:
+            return shapely.geometry.Point(*self.project_point(shapely_object.x, shapely_object.y), *([shapely_object.z] if shapely_object.has_z else []))
+        if (not interpolation or interpolation <= 1 or shapely_type == shapely.geometry.Point) and shapely_type in [shapely.geometry.Point, shapely.geometry.LineString, shapely.geometry.LinearRing, shapely.geometry.Polygon, shapely.geometry.MultiPoint, shapely.geometry.MultiLineString, shapely.geometry.MultiPolygon, shapely.geometry.GeometryCollection]:
+            return shapely.transform(shapely_object, self._project_coordinates, include_z = bool(shapely.has_z(shapely_object))) # all coordinates (of all parts) in a single call
+        if isinstance(shapely_object, shapely.geometry.base.BaseGeometry) and shapely.has_z(shapely_object): raise ValueError("Interpolation is only supported for 2D Shapely objects")
+        if shapely_type == shapely.geometry.LineString: return shapely.geometry.LineString(self.project_line(shapely.get_coordinates(shapely_object), interpolation))
+        elif shapely_type == shapely.geometry.LinearRing: return shapely.geometry.LinearRing(self.project_polygon(shapely.get_coordinates(shapely_object), interpolation, True))
+        elif shapely_type == shapely.geometry.Polygon:
+            exterior, *interiors = self._project_rings([shapely.get_coordinates(ring) for ring in [shapely_object.exterior, *shapely_object.interiors]], interpolation)
+            return shapely.geometry.Polygon(exterior, holes = interiors)
+        elif shapely_type == shapely.geometry.MultiPoint: return shapely.geometry.MultiPoint(self._project_points_array(shapely.get_coordinates(shapely_object)))
+        elif shapely_type == shapely.geometry.MultiLineString: return shapely.geometry.MultiLineString([self.project_line(shapely.get_coordinates(line), interpolation) for line in shapely_object.geoms])
+        elif shapely_type in [shapely.geometry.MultiPolygon, shapely.geometry.GeometryCollection]: return shapely_type(self._map(lambda internal_shapely_object: self.project_shapely_object(internal_shapely_object, interpolation), shapely_object.geoms, threaded))
         else: raise TypeError("Type of Shapely object must be one of [Point, LineString, LinearRing, Polygon, MultiPoint, MultiLineString, MultiPolygon, GeometryCollection]")
     
     def project_geojson_object(
         self, 
         geojson_object: dict, 
-        interpolation: Optional[int] = None
+        interpolation: Optional[int] = None,
+        threaded: bool = False,
+        copy_properties: bool = False
     ) -> dict:
         """
         Projects a GeoJSON object (`Point`, `MultiPoint`, `LineString`, `MultiLineString`, `Polygon`, `MultiPolygon`, `GeometryCollection`) 
@@ -180,6 +468,8 @@ class Projector:
         Args:
             `geojson_object` (`dict`): GeoJSON object
             `interpolation` (`int`, optional): Number of points projected per line (ignored if type is `Point`)
+            `threaded` (`bool`, optional): Whether the geometries of a `GeometryCollection` are projected in parallel threads
+            `copy_properties` (`bool`, optional): Whether members other than the coordinates (e.g. `properties`) are deep copied instead of shared with `geojson_object`
 
         Returns:
             `dict`: Projected GeoJSON object
@@ -187,20 +477,61 @@ class Projector:
         Raises:
             `TypeError`: If type of GeoJSON object isn't one of: `Point`, `MultiPoint`, `LineString`, `MultiLineString`, `Polygon`, `MultiPolygon`, `GeometryCollection`
         """
-        new_geojson_object = {k: copy.deepcopy(v) for k, v in geojson_object.items() if k not in ['coordinates', 'geometries']} # no need to deep copy the coordinates
+        new_geojson_object = {k: _clone_json(v) if copy_properties else v for k, v in geojson_object.items() if k not in ['coordinates', 'geometries']} # no need to copy the coordinates
         geojson_type = geojson_object['type']
         if geojson_type == 'Point': new_geojson_object['coordinates'] = list(self.project_point(*geojson_object['coordinates']))
-        elif geojson_type in ['MultiPoint', 'LineString']: new_geojson_object['coordinates'] = list(map(list, self.project_polygon(geojson_object['coordinates'], interpolation, True)))
-        elif geojson_type in ['MultiLineString', 'Polygon']: new_geojson_object['coordinates'] = [list(map(list, self.project_polygon(shape, interpolation, True))) for shape in geojson_object['coordinates']]
-        elif geojson_type == 'MultiPolygon': new_geojson_object['coordinates'] = [[list(map(list, self.project_polygon(ring, interpolation, True))) for ring in polygon] for polygon in geojson_object['coordinates']]
-        elif geojson_type == 'GeometryCollection': new_geojson_object['geometries'] = [self.project_geojson_object(internal_geojson_object, interpolation) for internal_geojson_object in geojson_object['geometries']]
+        elif geojson_type in ['MultiPoint', 'LineString']: new_geojson_object['coordinates'] = self._project_ring_lists([geojson_object['coordinates']], interpolation)[0]
+        elif geojson_type in ['MultiLineString', 'Polygon']: new_geojson_object['coordinates'] = self._project_ring_lists(geojson_object['coordinates'], interpolation)
+        elif geojson_type == 'MultiPolygon':
+            rings = iter(self._project_ring_lists([ring for polygon in geojson_object['coordinates'] for ring in polygon], interpolation))
+            new_geojson_object['coordinates'] = [[next(rings) for _ in polygon] for polygon in geojson_object['coordinates']]
+        elif geojson_type == 'GeometryCollection': new_geojson_object['geometries'] = self._map(lambda internal_geojson_object: self.project_geojson_object(internal_geojson_object, interpolation, copy_properties = copy_properties), geojson_object['geometries'], threaded)
         else: raise TypeError("Type of GeoJSON object must be one of [Point, MultiPoint, LineString, MultiLineString, Polygon, MultiPolygon, GeometryCollection]")
         return new_geojson_object
 
+    def project_iter(
+        self,
+        objects: Iterable[Union[dict, shapely.geometry.base.BaseGeometry]],
+        interpolation: Optional[int] = None,
+        workers: Optional[int] = None
+    ) -> Iterator[Union[dict, shapely.geometry.base.BaseGeometry]]:
+        '''
+        Projects many GeoJSON objects and/or Shapely objects from the start CRS to the destination CRS in parallel threads
+
+        Threads are used rather than processes since PyProj releases the GIL inside PROJ, and this avoids pickling the projector
+        (custom project functions are often lambdas); with a custom Python project function the objects are effectively projected one at a time
+
+        `objects` is consumed lazily, only a few objects per thread ahead of the results, so it can be a generator over a large dataset
+
+        Args:
+            `objects` (`Iterable[Union[dict, shapely.geometry.base.BaseGeometry]]`): GeoJSON objects (`dict`) and/or Shapely objects
+            `interpolation` (`int`, optional): Number of points projected per line (ignored if type is `Point`)
+            `workers` (`int`, optional): Number of threads (defaults to the number of CPUs)
+
+        Returns:
+            `Iterator[Union[dict, shapely.geometry.base.BaseGeometry]]`: Projected objects, in the order of `objects`
+        '''
+        def project_object(obj: Union[dict, shapely.geometry.base.BaseGeometry]) -> Union[dict, shapely.geometry.base.BaseGeometry]:
+            if isinstance(obj, dict): return self.project_geojson_object(obj, interpolation)
+            return self.project_shapely_object(obj, interpolation)
+
+        workers = workers or os.cpu_count() or 1
+        objects = iter(objects)
+        with ThreadPoolExecutor(max_workers = workers) as executor:
+            pending = deque(executor.submit(project_object, obj) for obj in islice(objects, 2 * workers)) # at most 2 * `workers` objects are read ahead
+            try:
+                while pending:
+                    result = pending.popleft().result()
+                    for obj in islice(objects, 1): pending.append(executor.submit(project_object, obj))
+                    yield result
+            finally: # e.g. the caller stopped iterating, don't wait for objects that won't be used
+                for future in pending: future.cancel()
+
     def project_tuple_transform(
         self, 
         transform: Tuple[float, float, float, float, float ,float], 
-        points_from: Iterable[Union[Tuple[float, float], List[float]]]
+        points_from: Iterable[Union[Tuple[float, float], List[float]]],
+        pinv: Optional[np.ndarray] = None
     ) -> Tuple[float, float, float, float, float, float]:
         """
         Computes the affine transformation that best maps points in `points_from` to coordinates in the destination CRS
@@ -212,13 +543,12 @@ class Projector:
         Args:
             `transform` (`Tuple[float, float, float, float, float ,float]`): Coefficients (a, b, c, d, e, f) of the affine geospatial transform that is being projected
             `points_from` (`Iterable[Union[Tuple[float, float], List[float]]]`): Points of the grid for which the projected transform will best fit
+            `pinv` (`np.ndarray`, optional): Precomputed `pseudo_inverse(points_from)`, to reuse when fitting many transforms on the same `points_from`
         
         Returns:
             `Tuple[float, float, float, float, float ,float]`: Projected transform
         """
-        a, b, c, d, e, f = transform
-        points_to = self.project_points([(a * x + b * y + c, d * x + e * y + f) for x, y in points_from])
-        return approximate_transform(points_from, points_to)
+        return self._project_transform(transform, points_from, pinv)
     
     def project_tuple_transform_grid(
         self, 
@@ -244,12 +574,13 @@ class Projector:
         Returns:
             `Tuple[float, float, float, float, float ,float]`: Projected transform
         """
-        return self.project_tuple_transform(transform, generate_points(x_range, y_range, b))
+        return self._project_transform_grid(transform, x_range, y_range, b)
     
     def project_affine_transform(
         self, 
         transform: Affine, 
-        points_from: Iterable[Union[Tuple[float, float], List[float]]]
+        points_from: Iterable[Union[Tuple[float, float], List[float]]],
+        pinv: Optional[np.ndarray] = None
     ) -> Affine:
         """
         Computes the affine transformation that best maps points in `points_from` to coordinates in the destination CRS
@@ -261,12 +592,35 @@ class Projector:
         Args:
             `transform` (`Affine`): Affine geospatial transform that is being projected
             `points_from` (`Iterable[Union[Tuple[float, float], List[float]]]`): Points of the grid for which the projected transform will best fit
+            `pinv` (`np.ndarray`, optional): Precomputed `pseudo_inverse(points_from)`, to reuse when fitting many transforms on the same `points_from`
         
         Returns:
             `Affine`: Projected transform
         """
-        points_to = self.project_points([transform * (x, y) for x, y in points_from])
-        return Affine(*approximate_transform(points_from, points_to))
+        return Affine(*self._project_transform(transform[:6], points_from, pinv))
+
+    def _project_transform(
+        self,
+        transform: Tuple[float, float, float, float, float, float],
+        points_from: Iterable[Union[Tuple[float, float], List[float]]],
+        pinv: Optional[np.ndarray] = None
+    ) -> Tuple[float, float, float, float, float, float]:
+        '''
+        Shared implementation of `project_tuple_transform` and `project_affine_transform`
+
+        The transform is applied to all of `points_from` with a single matrix product before the batched projection
+
+        Args:
+            `transform` (`Tuple[float, float, float, float, float ,float]`): Coefficients (a, b, c, d, e, f) of the affine geospatial transform that is being projected
+            `points_from` (`Iterable[Union[Tuple[float, float], List[float]]]`): Points of the grid for which the projected transform will best fit
+            `pinv` (`np.ndarray`, optional): Precomputed `pseudo_inverse(points_from)`, to reuse when fitting many transforms on the same `points_from`
+
+        Returns:
+            `Tuple[float, float, float, float, float ,float]`: Projected transform
+        '''
+        points_from = _as_points(points_from)
+        source = apply_affine(transform, points_from)
+        return approximate_transform(points_from, self._project_points_array(source), pinv)
     
     def project_affine_transform_grid(
         self, 
@@ -292,4 +646,37 @@ class Projector:
         Returns:
             `Affine`: Projected transform
         """
-        return self.project_affine_transform(transform, generate_points(x_range, y_range, b))
+        return Affine(*self._project_transform_grid(transform[:6], x_range, y_range, b))
+
+    def _project_transform_grid(
+        self,
+        transform: Tuple[float, float, float, float, float, float],
+        x_range: int,
+        y_range: int,
+        b: int = 3
+    ) -> Tuple[float, float, float, float, float, float]:
+        '''
+        Shared implementation of `project_tuple_transform_grid` and `project_affine_transform_grid`
+
+        Since the grid is the cartesian product of the axes from `generate_axes`, the transform is applied to each axis
+        and the results are broadcast together, instead of being applied to every point of the grid
+
+        The points in the start CRS are projected in place (see `_project_buffer`),
+        and the fit uses `approximate_transform_from_grid`, which never materializes the grid itself
+
+        Args:
+            `transform` (`Tuple[float, float, float, float, float ,float]`): Coefficients (a, b, c, d, e, f) of the affine geospatial transform that is being projected
+            `x_range` (`int`): Possible x values on the grid (0-indexed)
+            `y_range` (`int`): Possible y values on the grid (0-indexed)
+            `b` (`int`, optional): Block size used to choose points
+
+        Returns:
+            `Tuple[float, float, float, float, float ,float]`: Projected transform
+        '''
+        x_s, y_s = generate_axes(x_range, y_range, b)
+        sa, sb, sc, sd, se, sf = transform
+        source = np.stack([
+            ((sa * x_s + sc)[:, None] + (sb * y_s)[None, :]).ravel(),
+            ((sd * x_s + sf)[:, None] + (se * y_s)[None, :]).ravel()
+        ])
+        return approximate_transform_from_grid(x_s, y_s, self._project_buffer(source))
@@ -1,3 +1,3 @@
-from .helpers import interpolate_polygon, approximate_transform, generate_points
+from .helpers import interpolated_length, interpolate_polygon, approximate_transform, approximate_transform_matrix, approximate_transform_from_grid, pseudo_inverse, apply_affine, generate_axes, generate_points
 
-__all__ = ['interpolate_polygon', 'approximate_transform', 'generate_points']
\ No newline at end of file
+__all__ = ['interpolated_length', 'interpolate_polygon', 'approximate_transform', 'approximate_transform_matrix', 'approximate_transform_from_grid', 'pseudo_inverse', 'apply_affine', 'generate_axes', 'generate_points']
\ No newline at end of file
@@ -1,23 +1,62 @@
 from rasterio.transform import Affine
 
-from typing import Union, Iterable, List, Tuple
+from typing import Optional, Union, Iterable, List, Tuple, Sequence
 
 import numpy as np
 
-def interpolate_polygon(polygon: Iterable[Union[Tuple[float, float], List[float]]], interpolation: int = 4, self_closing: bool = False) -> Iterable[Tuple[float, float]]:
-    interpolated_polygon = []
-    n = len(polygon) - int(self_closing)
-    for idx in range(n):
-        x_initial, y_initial = polygon[idx]
-        x_next, y_next = polygon[(idx + 1) % n]
-        x_diff = (x_next - x_initial) / interpolation
-        y_diff = (y_next - y_initial) / interpolation
-        for i in range(interpolation):
-            interpolated_polygon.append((x_initial + i * x_diff, y_initial + i * y_diff))
-    if self_closing: interpolated_polygon.append(polygon[0])
-    return interpolated_polygon
+def _as_points(points: Iterable[Union[Tuple[float, float], List[float]]]) -> np.ndarray:
+    '''
+    Converts `points` to an (N, 2) float64 array (without copying if it already is one), raising `ValueError` if they aren't (x, y) pairs
+    '''
+    if not isinstance(points, (np.ndarray, Sequence)): points = list(points) # e.g. set, dict.values()
+    points = np.asarray(points, dtype = np.float64)
+    if points.size == 0: return points.reshape(0, 2)
+    if points.ndim != 2 or points.shape[1] != 2: raise ValueError(f"Points must be (x, y) pairs, got an array of shape {points.shape}")
+    return points
+
+def interpolated_length(n: int, interpolation: int = 4, self_closing: bool = False) -> int:
+    '''
+    Returns the number of points `interpolate_polygon` produces for a polygon of `n` points
+    '''
+    if self_closing: return max(n - 1, 0) * interpolation + min(n, 1)
+    return n * interpolation
+
+def interpolate_polygon(polygon: Iterable[Union[Tuple[float, float], List[float]]], interpolation: int = 4, self_closing: bool = False, out: Optional[np.ndarray] = None) -> np.ndarray:
+    '''
+    Interpolates `interpolation` points per segment of `polygon`, written to `out` (of shape (`interpolated_length(...)`, 2)) if passed
+    '''
+    polygon = _as_points(polygon)
+    vertices = np.concatenate([polygon[:len(polygon) - int(self_closing)], polygon[:1]]) # first vertex repeated at the end, so segments never wrap around
+    starts, ends = vertices[:-1], vertices[1:]
+    n = len(starts) * interpolation
+    if out is None: out = np.empty((interpolated_length(len(polygon), interpolation, self_closing), 2), dtype = np.float64)
+    t = np.linspace(0, 1, interpolation, endpoint = False)[None, :, None]
+    segments = out[:n].reshape(len(starts), interpolation, 2) # a view, since only the first axis is split
+    np.add(starts[:, None, :], t * (ends - starts)[:, None, :], out = segments)
+    if self_closing: out[n:] = vertices[-1:]
+    return out
     
-def approximate_transform(points_from: Iterable[Union[Tuple[float, float], List[float]]], points_to: Iterable[Union[Tuple[float, float], List[float]]]) -> Tuple[float, float, float, float, float, float]:
+def pseudo_inverse(points_from: Iterable[Union[Tuple[float, float], List[float]]]) -> np.ndarray:
+    """
+    Computes the (3, N) matrix mapping `points_to` to the least squares solution x (see `approximate_transform_matrix`),
+    which only depends on `points_from`, so that fitting transforms from the same `points_from` to different `points_to` only takes a matrix product
+
+    Args:
+        points_from (Iterable[Union[Tuple[float, float], List[float]]]): List of source (x, y) points.
+
+    Returns:
+        np.ndarray: Pseudo-inverse of the design matrix A.
+    """
+    points_from = _as_points(points_from)
+    mean = points_from.mean(axis = 0)
+    centered = points_from - mean
+    try:
+        linear = np.linalg.solve(centered.T @ centered, centered.T)
+    except np.linalg.LinAlgError:
+        linear = np.linalg.pinv(centered)
+    return np.vstack([linear, 1 / len(points_from) - mean @ linear])
+
+def approximate_transform_matrix(points_from: Iterable[Union[Tuple[float, float], List[float]]], points_to: Iterable[Union[Tuple[float, float], List[float]]], pinv: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Computes the affine transformation that best maps `points_from` to `points_to`
     using a least squares approach
@@ -34,27 +73,109 @@ def approximate_transform(points_from: Iterable[Union[Tuple[float, float], List[
         | ....... |       | c f |       | ....... |
              A               x               B
 
+    Both point sets are first centred on their means, which keeps the normal equations well conditioned for large coordinates (e.g. UTM);
+    (a, b, d, e) then solve the 2 x 2 normal equations of the centred points (falling back to `np.linalg.lstsq` if they are singular),
+    and c and f follow from the means, or x = `pinv` . B if `pinv` is passed
+
     Args:
         points_from (Iterable[Union[Tuple[float, float], List[float]]]): List of source (x, y) points.
         points_to (Iterable[Union[Tuple[float, float], List[float]]]): List of target (x', y') points.
+        pinv (np.ndarray, optional): Precomputed `pseudo_inverse(points_from)`.
+
+    Returns:
+        np.ndarray: (2, 3) matrix [[a, b, c], [d, e, f]] of the best-fit affine transformation.
+    """
+    points_to = _as_points(points_to)
+    mean_to = points_to.mean(axis = 0)
+    if pinv is not None:
+        x = pinv @ (points_to - mean_to) # pinv . (1, ..., 1) = (0, 0, 1), so the mean only shifts c and f
+        x[2] += mean_to
+    else:
+        points_from = _as_points(points_from)
+        mean_from = points_from.mean(axis = 0)
+        centered_from, centered_to = points_from - mean_from, points_to - mean_to
+        try:
+            linear = np.linalg.solve(centered_from.T @ centered_from, centered_from.T @ centered_to)
+        except np.linalg.LinAlgError:
+            linear, _, _, _ = np.linalg.lstsq(centered_from, centered_to, rcond = None)
+        x = np.vstack([linear, mean_to - mean_from @ linear])
+    return np.ascontiguousarray(x.T)
+
+def approximate_transform(points_from: Iterable[Union[Tuple[float, float], List[float]]], points_to: Iterable[Union[Tuple[float, float], List[float]]], pinv: Optional[np.ndarray] = None) -> Tuple[float, float, float, float, float, float]:
+    """
+    Same as `approximate_transform_matrix`, returning the coefficients as a tuple
+
+    Args:
+        points_from (Iterable[Union[Tuple[float, float], List[float]]]): List of source (x, y) points.
+        points_to (Iterable[Union[Tuple[float, float], List[float]]]): List of target (x', y') points.
+        pinv (np.ndarray, optional): Precomputed `pseudo_inverse(points_from)`.
+
+    Returns:
+        Tuple[float, float, float, float, float, float]: Coefficients (a, b, c, d, e, f) of the best-fit affine transformation.
+    """
+    return tuple(approximate_transform_matrix(points_from, points_to, pinv).ravel())
+
+def approximate_transform_from_grid(xs: np.ndarray, ys: np.ndarray, points_to: Iterable[Union[Tuple[float, float], List[float]]]) -> Tuple[float, float, float, float, float, float]:
+    """
+    Same as `approximate_transform`, for `points_from` being the cartesian product of the axes `xs` and `ys`
+    (in the order of `generate_points`, so `points_to` reshapes to (len(`xs`), len(`ys`), 2))
+
+    Since every x is paired with every y, once the axes and `points_to` are centred on their means Aᵀ A is diagonal
+    (with entries only depending on the axes), and Aᵀ B reduces over one axis of `points_to` at a time, so the source points are never materialized
+
+    Args:
+        xs (np.ndarray): x coordinates of the grid.
+        ys (np.ndarray): y coordinates of the grid.
+        points_to (Iterable[Union[Tuple[float, float], List[float]]]): List of target (x', y') points.
 
     Returns:
         Tuple[float, float, float, float, float, float]: Coefficients (a, b, c, d, e, f) of the best-fit affine transformation.
     """
-    A = np.array([[x, y, 1] for x, y in points_from])
-    b = np.array([[x, y] for x, y in points_to])
-    x, _, _, _ = np.linalg.lstsq(A, b, rcond = None)
-    return (x[0, 0], x[1, 0], x[2, 0], x[0, 1], x[1, 1], x[2, 1])
+    xs, ys = np.asarray(xs, dtype = np.float64), np.asarray(ys, dtype = np.float64)
+    nx, ny = len(xs), len(ys)
+    b = _as_points(points_to).reshape(nx, ny, 2)
+    mean_x, mean_y, mean_to = xs.mean(), ys.mean(), b.mean(axis = (0, 1))
+    centered_xs, centered_ys, b = xs - mean_x, ys - mean_y, b - mean_to
+    sxx, syy = ny * (centered_xs @ centered_xs), nx * (centered_ys @ centered_ys)
+    if sxx == 0 or syy == 0: # a single row or column
+        X, Y = np.meshgrid(xs, ys, indexing = 'ij')
+        return approximate_transform(np.column_stack([X.ravel(), Y.ravel()]), (b + mean_to).reshape(-1, 2))
+    ad = centered_xs @ b.sum(axis = 1) / sxx
+    be = centered_ys @ b.sum(axis = 0) / syy
+    cf = mean_to - mean_x * ad - mean_y * be
+    return (ad[0], be[0], cf[0], ad[1], be[1], cf[1])
+
+def apply_affine(transform: Union[np.ndarray, Tuple[float, ...]], points: Iterable[Union[Tuple[float, float], List[float]]]) -> np.ndarray:
+    """
+    Applies the affine transform (a, b, c, d, e, f) to all of `points` with a single matrix product
+
+    Args:
+        transform (Union[np.ndarray, Tuple[float, ...]]): (2, 3) matrix [[a, b, c], [d, e, f]], or any sequence starting with (a, b, c, d, e, f) (such as an `Affine`).
+        points (Iterable[Union[Tuple[float, float], List[float]]]): List of (x, y) points.
+
+    Returns:
+        np.ndarray: (N, 2) array of transformed points.
+    """
+    M = np.asarray(transform, dtype = np.float64).reshape(-1)[:6].reshape(2, 3)
+    return _as_points(points) @ M[:, :2].T + M[:, 2]
 
-def generate_points(x_range: int, y_range: int, b: int = 3) -> Iterable[Tuple[float, float]]:
+def _axis(n: int, b: int) -> np.ndarray:
+    k = n // b
+    axis = np.arange(k + int(n % b != 0), dtype = np.float64) * b + (b - 1) // 2
+    if n % b != 0: axis[k] = b * k + (n % b - 1) // 2
+    return axis
+
+def generate_axes(x_range: int, y_range: int, b: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+    '''
+    Given square with size x_range * y_range, and block size b
+    Returns the x and y coordinates representing each b x b subsquare (the grid of `generate_points` is their cartesian product)
+    '''
+    return _axis(x_range, b), _axis(y_range, b)
+
+def generate_points(x_range: int, y_range: int, b: int = 3) -> np.ndarray:
     '''
     Given square with size x_range * y_range, and block size b
-    Returns list of points, with each b x b subsquare being represented by a point
-    '''
-    x_s = [b * i + ((b - 1) // 2) for i in range(x_range // b)]
-    if x_range % b != 0:
-        x_s.append(b * (x_range // b) + max(b - 1, (x_range - 1) % b) // 2)
-    y_s = [b * i + ((b - 1) // 2) for i in range(y_range // b)]
-    if y_range % b != 0:
-        y_s.append(b * (y_range // b) + max(b - 1, (x_range - 1) % b) // 2)
-    return [(x, y) for x in x_s for y in y_s]
\ No newline at end of file
+    Returns (N, 2) array of points, with each b x b subsquare being represented by a point
+    '''
+    X, Y = np.meshgrid(*generate_axes(x_range, y_range, b), indexing = 'ij')
+    return np.column_stack([X.ravel(), Y.ravel()])
@@ -1,10 +1,15 @@
 from crswitch import Projector
-from crswitch.util import generate_points
+from crswitch.projector import _parse_crs, _cached_crs
+from pyproj import CRS
+from pyproj.exceptions import CRSError
+from crswitch.util import generate_points, generate_axes, apply_affine, approximate_transform, approximate_transform_matrix, approximate_transform_from_grid, pseudo_inverse, interpolate_polygon, interpolated_length
 from rasterio import Affine
-from math import sqrt
+import json
+import pytest
+import shapely
+import shapely.geometry
+import numpy as np
 
-def dist(p1, p2):
-    return sqrt((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2)
 
 def test_project_transform():
     size = 2048
@@ -13,11 +18,298 @@ def test_project_transform():
     projector = Projector(3857, 4326)
     points = generate_points(size, size)
 
-    new_transform = projector.project_transform_custom(transform, points)
+    new_transform = projector.project_affine_transform(transform, points)
 
-    real_final_coordinates = projector.project_points([transform * point for point in points])
-    approximate_final_coordinates = [new_transform * point for point in points]
+    real_final_coordinates = projector.project_points(apply_affine(transform, points))
+    approximate_final_coordinates = apply_affine(new_transform, points)
 
-    print(max(sqrt(dist(real_final_coordinates[i], approximate_final_coordinates[i])) for i in range(len(points))))
+    error = np.max(np.linalg.norm(real_final_coordinates - approximate_final_coordinates, axis = 1))
 
-test_project_transform()
\ No newline at end of file
+    assert error < 1e-5
+
+
+def test_project_geojson_object_iterable_twice():
+    projector = Projector(4326, 3857)
+
+    for geojson_object in [
+        {'type': 'LineString', 'coordinates': [[0, 0], [1, 1], [2, 0]]},
+        {'type': 'Polygon', 'coordinates': [[[0, 0], [1, 0], [1, 1], [0, 0]]]},
+        {'type': 'MultiPolygon', 'coordinates': [[[[0, 0], [1, 0], [1, 1], [0, 0]]], [[[2, 2], [3, 2], [3, 3], [2, 2]]]]},
+    ]:
+        projected = projector.project_geojson_object(geojson_object, 2)
+
+        assert json.dumps(projected) == json.dumps(projected)
+        assert list(projected['coordinates']) == list(projected['coordinates'])
+        assert isinstance(projected['coordinates'], list)
+
+
+def test_generate_points_inside_grid():
+    for x_range, y_range, b in [(7, 5, 3), (5, 7, 3), (2048, 2047, 3), (10, 10, 4)]:
+        points = generate_points(x_range, y_range, b)
+
+        assert len(points) == -(-x_range // b) * -(-y_range // b)
+        assert points[:, 0].min() >= 0 and points[:, 0].max() < x_range
+        assert points[:, 1].min() >= 0 and points[:, 1].max() < y_range
+        assert points.flags.writeable
+
+
+def test_approximate_transform_from_grid():
+    for x_range, y_range, b in [(200, 150, 3), (1, 150, 3), (200, 2, 3)]: # a single column / row makes the fit underdetermined
+        points = generate_points(x_range, y_range, b)
+        points_to = np.column_stack([2 * points[:, 0] - points[:, 1] + 5, np.sin(points[:, 0]) + 0.5 * points[:, 1]])
+
+        assert np.allclose(approximate_transform_from_grid(*generate_axes(x_range, y_range, b), points_to), approximate_transform(points, points_to))
+
+
+def test_project_points_input_shapes():
+    projector = Projector(4326, 3857)
+    points = [(10, 20), (11, 21)]
+
+    assert sorted(projector.project_points(set(points))) == sorted(projector.project_points(points))
+    assert projector.project_points({0: points[0], 1: points[1]}.values()) == projector.project_points(points)
+    assert projector.project_points([]) == []
+
+    for n in [1, 5, 16, 17, 100]: # projected one by one, then as an array
+        points = [(10 + i / 10, 20 - i / 10) for i in range(n)]
+        assert np.allclose(projector.project_points(points), projector.project_points(np.array(points)))
+
+    with pytest.raises(ValueError):
+        projector.project_points([(10, 20, 5), (11, 21, 6)])
+
+
+def test_project_geojson_object_rejects_3d_coordinates():
+    projector = Projector(4326, 3857)
+
+    for geojson_object in [
+        {'type': 'LineString', 'coordinates': [[10, 20, 100], [11, 21, 200]]},
+        {'type': 'Polygon', 'coordinates': [[[0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 0, 1]]]},
+    ]:
+        for interpolation in [None, 2]:
+            with pytest.raises(ValueError):
+                projector.project_geojson_object(geojson_object, interpolation)
+
+
+def test_approximate_transform_large_coordinates():
+    transform = np.array([[0.9, 0.1, 123.0], [-0.2, 1.1, -4567.0]])
+
+    for extent in [1000, 10]:
+        xs, ys = 500000 + np.arange(50) * extent / 50, 4000000 + np.arange(40) * extent / 40
+        points = np.column_stack([np.repeat(xs, len(ys)), np.tile(ys, len(xs))])
+        points_to = apply_affine(transform, points)
+
+        for fit in [approximate_transform(points, points_to), approximate_transform(points, points_to, pseudo_inverse(points)), approximate_transform_from_grid(xs, ys, points_to)]:
+            assert np.max(np.abs(apply_affine(fit, points) - points_to)) < 1e-6
+
+
+def test_project_iter():
+    projector = Projector(4326, 3857)
+    objects = [{'type': 'Point', 'coordinates': [i, i]} if i % 2 else shapely.geometry.Point(i, i) for i in range(50)]
+
+    projected = list(projector.project_iter(objects, workers = 4))
+
+    assert [type(obj) for obj in projected] == [type(obj) for obj in objects]
+    for obj, projected_obj in zip(objects, projected):
+        expected = projector.project_geojson_object(obj) if isinstance(obj, dict) else projector.project_shapely_object(obj)
+        assert (projected_obj == expected) if isinstance(obj, dict) else projected_obj.equals(expected)
+
+    consumed = []
+    def generate():
+        for i in range(10000):
+            consumed.append(i)
+            yield {'type': 'Point', 'coordinates': [0, 0]}
+
+    iterator = projector.project_iter(generate(), workers = 2)
+    next(iterator)
+    assert len(consumed) <= 8
+    iterator.close()
+
+
+class DeviceArray:
+    '''
+    Stands in for a GPU array (e.g. CuPy's), which must be copied to the host explicitly with `get`
+    '''
+    def __init__(self, array):
+        self.array = np.asarray(array, dtype = np.float64)
+
+    def __array__(self, *args, **kwargs):
+        raise TypeError("Implicit conversion to a NumPy array is not allowed.")
+
+    def get(self):
+        return self.array.copy()
+
+
+class DeviceTransformer:
+    def transform(self, xs, ys):
+        return DeviceArray(np.asarray(xs) * 2), DeviceArray(np.asarray(ys) + 1)
+
+
+def test_from_pyproj_transformer_device_arrays():
+    projector = Projector.from_pyproj_transformer(DeviceTransformer())
+
+    assert projector.project_points([(1, 2), (3, 4)]) == [(2, 3), (6, 5)]
+    assert projector.project_geojson_object({'type': 'LineString', 'coordinates': [[1, 2], [3, 4]]})['coordinates'] == [[2, 3], [6, 5]]
+    assert np.allclose(projector.project_tuple_transform_grid((1, 0, 0, 0, 1, 0), 30, 30), (2, 0, 0, 0, 1, 1))
+    assert np.allclose(projector.project_tuple_transform((1, 0, 0, 0, 1, 0), generate_points(30, 30)), (2, 0, 0, 0, 1, 1))
+
+
+def test_same_crs_projector_is_identity():
+    points = [(10.5, 20.25), (11.0, -21.75), (-179.0, 89.0)]
+
+    for projector in [Projector(4326, "EPSG:4326"), Projector(4326, "OGC:CRS84")]: # CRS84 is EPSG:4326 with the axis order swapped
+        assert projector._transformer is None
+        assert projector.project_points(points) == points
+        assert projector.project_polygon(points) == points
+        assert projector.project_geojson_object({'type': 'Polygon', 'coordinates': [[list(point) for point in points]]})['coordinates'] == [[list(point) for point in points]]
+
+    assert Projector(4326, 3857)._transformer is not None
+
+
+def test_project_geojson_object_properties():
+    projector = Projector(4326, 3857)
+    geojson_object = {'type': 'Point', 'coordinates': [1, 2], 'properties': {'name': 'a', 'tags': ['x', 'y']}}
+
+    shared = projector.project_geojson_object(geojson_object)
+    assert shared['properties'] is geojson_object['properties']
+
+    copied = projector.project_geojson_object(geojson_object, copy_properties = True)
+    assert copied['properties'] == geojson_object['properties']
+    copied['properties']['tags'].append('z')
+    copied['properties']['name'] = 'b'
+    assert geojson_object['properties'] == {'name': 'a', 'tags': ['x', 'y']}
+
+
+def test_project_shapely_object_keeps_z():
+    projector = Projector(4326, 3857)
+    line = shapely.geometry.LineString([(0, 0, 5), (1, 1, 6)])
+
+    projected = projector.project_shapely_object(line)
+    assert projected.has_z
+    assert np.allclose(shapely.get_coordinates(projected, include_z = True), np.column_stack([projector.project_points(np.array([(0, 0), (1, 1)], dtype = float)), [5, 6]]))
+    assert projector.project_shapely_object(shapely.geometry.Point(1, 2, 3), 4).z == 3
+    assert projector.project_shapely_object(shapely.geometry.Point(1, 2)).equals(shapely.geometry.Point(*projector.project_point(1, 2)))
+    assert projector.project_shapely_object(shapely.geometry.Point()).is_empty
+    assert not projector.project_shapely_object(shapely.geometry.LineString([(0, 0), (1, 1)])).has_z
+
+    with pytest.raises(ValueError):
+        projector.project_shapely_object(line, 4)
+
+
+def test_project_geojson_object_small_and_large_rings():
+    projector = Projector(4326, 3857)
+
+    for n in [4, 16, 40]: # projected one point at a time, then through a buffer
+        ring = [[i / 10, (i % 3) / 10] for i in range(n - 1)] + [[0, 0]]
+        projected = projector.project_geojson_object({'type': 'Polygon', 'coordinates': [ring, ring]})['coordinates']
+
+        assert all(isinstance(point, list) for point in projected[0])
+        assert np.allclose(projected, [projector.project_points(np.array(ring))] * 2)
+
+
+def test_threaded_projection_matches_sequential():
+    projector = Projector(4326, 3857)
+    square = lambda x, y: [(x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1), (x, y)]
+
+    multi_polygon = shapely.geometry.MultiPolygon([shapely.geometry.Polygon(square(i, i)) for i in range(8)])
+    collection = shapely.geometry.GeometryCollection([multi_polygon, shapely.geometry.LineString(square(0, 5)), shapely.geometry.Point(1, 1)])
+    for shapely_object in [multi_polygon, collection]:
+        assert projector.project_shapely_object(shapely_object, 4, threaded = True).equals_exact(projector.project_shapely_object(shapely_object, 4), 0)
+
+    geojson_object = {'type': 'GeometryCollection', 'geometries': [
+        {'type': 'Polygon', 'coordinates': [[list(point) for point in square(i, i)]]} for i in range(8)
+    ] + [{'type': 'Point', 'coordinates': [1, 1]}]}
+    assert projector.project_geojson_object(geojson_object, 4, threaded = True) == projector.project_geojson_object(geojson_object, 4)
+
+
+def test_project_points_iterator():
+    points = [(10 + i / 10, 20 - i / 10) for i in range(40)]
+
+    for projector in [Projector(4326, 3857), Projector(project_function = Projector(4326, 3857).project_point)]: # itransform, then the list fallback
+        assert np.allclose(projector.project_points(iter(points)), projector.project_points(points))
+        assert np.allclose(projector.project_points(point for point in points[:3]), projector.project_points(points[:3]))
+
+        with pytest.raises(ValueError):
+            projector.project_points(iter([(1, 2, 3)]))
+
+
+def test_project_points_xy():
+    xs, ys = np.array([0.0, 10.5, -20.0]), np.array([0.0, 45.25, -60.0])
+    projector = Projector(4326, 3857)
+    expected = np.array([projector.project_point(x, y) for x, y in zip(xs, ys)])
+
+    for kind, projector, expected in [
+        ('crs', projector, expected),
+        ('identity', Projector(4326, "EPSG:4326"), np.column_stack([xs, ys])),
+        ('affine', Projector.from_affine_transform(Affine(2, 0, 1, 0, -3, 5)), np.column_stack([2 * xs + 1, -3 * ys + 5])),
+        ('custom', Projector(project_function = lambda x, y: (y, x)), np.column_stack([ys, xs])), # per point fallback
+    ]:
+        projected_xs, projected_ys = projector.project_points_xy(xs, ys)
+
+        assert np.allclose(np.column_stack([projected_xs, projected_ys]), expected), kind
+        assert len(projected_xs) == len(projected_ys) == len(xs), kind
+
+
+def test_interpolate_polygon_out():
+    polygon = [(0, 0), (4, 0), (4, 2), (0, 0)]
+
+    for vertices in [polygon, polygon[:1], []]:
+        for self_closing in [True, False]:
+            for interpolation in [1, 4]:
+                expected = interpolate_polygon(vertices, interpolation, self_closing)
+                n = interpolated_length(len(vertices), interpolation, self_closing)
+                assert expected.shape == (n, 2)
+
+                buffer = np.full((2, n + 5), np.nan)
+                out = buffer.T[2:2 + n] # not contiguous
+                assert interpolate_polygon(vertices, interpolation, self_closing, out = out) is out
+                assert np.array_equal(buffer.T[2:2 + n], expected)
+                assert np.isnan(buffer.T[:2]).all() and np.isnan(buffer.T[2 + n:]).all()
+
+    assert np.array_equal(interpolate_polygon(polygon, 2, True), [(0, 0), (2, 0), (4, 0), (4, 1), (4, 2), (2, 1), (0, 0)])
+    assert np.array_equal(interpolate_polygon(polygon[:1], 3, False), [(0, 0)] * 3)
+    assert np.array_equal(interpolate_polygon(polygon[:1], 3, True), [(0, 0)])
+
+
+def test_approximate_transform_matrix():
+    points = generate_points(30, 20)
+    points_to = np.column_stack([2 * points[:, 0] - points[:, 1] + 5, np.sin(points[:, 0]) + 0.5 * points[:, 1]])
+
+    matrix = approximate_transform_matrix(points, points_to)
+    assert matrix.shape == (2, 3)
+    assert np.allclose(matrix.ravel(), approximate_transform(points, points_to))
+    assert np.allclose(matrix[0], (2, -1, 5))
+
+    collinear = np.column_stack([np.arange(10.0), 2 * np.arange(10.0)]) # singular normal equations
+    transform = np.array([[1.0, 0.5, 3.0], [-2.0, 0.25, 1.0]])
+    matrix = approximate_transform_matrix(collinear, apply_affine(transform, collinear))
+    assert np.all(np.isfinite(matrix))
+    assert np.allclose(apply_affine(matrix, collinear), apply_affine(transform, collinear))
+
+
+def test_invalid_crs():
+    with pytest.raises(CRSError) as error:
+        Projector("not a crs", 4326)
+    assert error.value.__cause__ is not None
+
+    with pytest.raises(CRSError):
+        Projector(4326, None)
+
+
+def test_unhashable_crs_input():
+    proj_parameters = {'proj': 'longlat', 'datum': 'WGS84', 'no_defs': True}
+    cached = _cached_crs.cache_info().currsize
+
+    assert _parse_crs(proj_parameters) == CRS.from_user_input(proj_parameters)
+    assert _cached_crs.cache_info().currsize == cached # not cached, since dicts aren't hashable
+
+    projector = Projector(proj_parameters, 3857)
+    assert np.allclose(projector.project_points([(10, 20)]), Projector(4326, 3857).project_points([(10, 20)]))
+
+
+def test_project_transform_with_pseudo_inverse():
+    projector = Projector(3857, 4326)
+    transform = Affine(1.953125, 0.0, 3953800.0, 0.0, -1.953125, 4011000.0)
+    points = generate_points(256, 256)
+    pinv = pseudo_inverse(points)
+
+    assert np.allclose(projector.project_affine_transform(transform, points, pinv), projector.project_affine_transform(transform, points), rtol = 1e-9, atol = 1e-12)
+    assert np.allclose(projector.project_tuple_transform(transform[:6], points, pinv), projector.project_tuple_transform(transform[:6], points), rtol = 1e-9, atol = 1e-12)